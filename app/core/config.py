@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any, Set
 import json
@@ -82,11 +82,16 @@ class AppConfig:
     def to_json(self) -> Dict[str, Any]:
         """Serialize configuration to JSON-compatible dict."""
 
-        data = asdict(self)
-        for key, value in list(data.items()):
-            if isinstance(value, Path):
-                data[key] = str(value)
-        return data
+        return {
+            "instances_path": str(self.instances_path),
+            "game_path": str(self.game_path),
+            "backup_dir": str(self.backup_dir) if self.backup_dir else None,
+            "auto_confirm_new_files": self.auto_confirm_new_files,
+            "auto_confirm_updates": self.auto_confirm_updates,
+            "auto_confirm_removals": self.auto_confirm_removals,
+            "exclusions_path": str(self.exclusions_path) if self.exclusions_path else None,
+            "history_path": str(self.history_path) if self.history_path else None,
+        }
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "AppConfig":
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Union
 
 
 class FileAction(str, Enum):
@@ -17,7 +18,7 @@ class FileAction(str, Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """Represents a single file change between source and target directories."""
 
@@ -42,11 +43,13 @@ class SyncPlan:
     def is_empty(self) -> bool:
         return not (self.adds or self.updates or self.removals)
 
-    def all_changes(self) -> Sequence[FileChange]:
-        return [*self.adds, *self.updates, *self.removals, *self.skipped]
+    def all_changes(self) -> Iterator[FileChange]:
+        # Lazy chain instead of a flattened copy; large plans are iterated
+        # once, not duplicated.
+        return chain(self.adds, self.updates, self.removals, self.skipped)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModpackInfo:
     """Metadata for a detected modpack."""
 
@@ -56,7 +59,7 @@ class ModpackInfo:
     manifest_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncLogEntry:
     """Record of a sync operation."""
 
@@ -66,11 +69,11 @@ class SyncLogEntry:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncHistory:
     """Persistent history for a modpack."""
 
     modpack_name: str
-    files: Dict[str, Dict[str, Optional[str]]] = field(default_factory=dict)
+    files: Dict[str, Dict[str, Union[str, int, float, None]]] = field(default_factory=dict)
     exclusions: List[str] = field(default_factory=list)
     last_synced: Optional[float] = None
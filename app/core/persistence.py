@@ -5,53 +5,153 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Optional
 import json
+import os
 import threading
 import time
 
 from .models import SyncHistory, FileChange
 
+# orjson serializes/parses several times faster than the stdlib; fall back
+# to json when it is not installed.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# ijson streams very large history files key-by-key instead of materializing
+# one giant parse tree; optional like orjson.
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+# msgpack stores the history as one contiguous binary buffer: smaller on
+# disk and decoded without the per-entry string parsing JSON needs. When
+# installed it becomes the write format; JSON files from earlier runs are
+# still recognized by their first byte and read as before.
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+_JSON_ERRORS = (json.JSONDecodeError, ValueError, OSError)
+if ijson is not None:
+    _JSON_ERRORS = _JSON_ERRORS + (ijson.JSONError,)
+if msgpack is not None:
+    _JSON_ERRORS = _JSON_ERRORS + (msgpack.exceptions.UnpackException,)
+
+
+def _is_msgpack_map(first_byte: int) -> bool:
+    """Check whether a leading byte opens a msgpack map.
+
+    The history payload is always a top-level map, so fixmap/map16/map32
+    headers identify the binary format; JSON starts with ``{`` or
+    whitespace, which none of these overlap.
+    """
+
+    return 0x80 <= first_byte <= 0x8F or first_byte in (0xDE, 0xDF)
+
+# Above this size, prefer incremental parsing to bound peak memory.
+_STREAM_THRESHOLD = 4 * 1024 * 1024
+
+
+def _dumps(data: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Coalescing window for rapid mutations such as exclusion toggles; one write
+# lands this long after the last change instead of one write per change.
+_FLUSH_DELAY = 0.25
+
 
 class SyncHistoryStore:
-    """Manage persistence of sync history data."""
+    """Manage persistence of sync history data.
+
+    Mutations update the in-memory cache and mark the store dirty; the file
+    is rewritten once per batch via :meth:`flush` rather than on every call.
+    """
 
     def __init__(self, history_path: Path) -> None:
         self.history_path = history_path
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._cache: Dict[str, SyncHistory] = {}
+        self._raw: Optional[Dict[str, Dict]] = None
+        self._loaded = False
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         self.history_path.parent.mkdir(parents=True, exist_ok=True)
 
     def _read_raw(self) -> Dict[str, Dict]:
         if not self.history_path.exists():
             return {}
         try:
-            return json.loads(self.history_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            with self.history_path.open("rb") as fh:
+                first = fh.read(1)
+                if first and _is_msgpack_map(first[0]):
+                    # Binary history from a msgpack-enabled install. Without
+                    # the decoder it is handled like any unreadable file.
+                    if msgpack is None:
+                        return {}
+                    return msgpack.unpackb(first + fh.read(), raw=False)
+                if ijson is not None and self.history_path.stat().st_size > _STREAM_THRESHOLD:
+                    fh.seek(0)
+                    # use_float keeps mtimes as floats; ijson's default
+                    # Decimal never compares equal to st_mtime (killing the
+                    # hash cache) and is unserializable on the next flush.
+                    return dict(ijson.kvitems(fh, "", use_float=True))
+                return _loads(first + fh.read())
+        except _JSON_ERRORS:
             return {}
 
     def _write_raw(self, data: Dict[str, Dict]) -> None:
-        self.history_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Write to a sibling temp file and replace atomically so a crash
+        # mid-write cannot truncate the history.
+        payload = (
+            msgpack.packb(data, use_bin_type=True) if msgpack is not None else _dumps(data)
+        )
+        tmp_path = self.history_path.with_suffix(".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.history_path)
+
+    def _ensure_raw(self) -> Dict[str, Dict]:
+        if self._raw is None:
+            self._raw = self._read_raw()
+        return self._raw
+
+    def _materialize(self, modpack_name: str) -> SyncHistory:
+        payload = self._ensure_raw().get(modpack_name)
+        if payload is None:
+            return SyncHistory(modpack_name=modpack_name)
+        return SyncHistory(
+            modpack_name=modpack_name,
+            files=payload.get("files", {}),
+            exclusions=payload.get("exclusions", []),
+            last_synced=payload.get("last_synced"),
+        )
 
     def load_all(self) -> Dict[str, SyncHistory]:
         with self._lock:
-            if self._cache:
+            if self._loaded:
                 return self._cache
-            raw = self._read_raw()
-            for modpack, payload in raw.items():
-                self._cache[modpack] = SyncHistory(
-                    modpack_name=modpack,
-                    files=payload.get("files", {}),
-                    exclusions=payload.get("exclusions", []),
-                    last_synced=payload.get("last_synced"),
-                )
+            for modpack in self._ensure_raw():
+                if modpack not in self._cache:
+                    self._cache[modpack] = self._materialize(modpack)
+            self._loaded = True
             return self._cache
 
     def get_history(self, modpack_name: str) -> SyncHistory:
-        histories = self.load_all()
-        if modpack_name in histories:
-            return histories[modpack_name]
-        history = SyncHistory(modpack_name=modpack_name)
-        histories[modpack_name] = history
-        return history
+        with self._lock:
+            if modpack_name not in self._cache:
+                self._cache[modpack_name] = self._materialize(modpack_name)
+            return self._cache[modpack_name]
 
     def append_log(self, modpack_name: str, changes: Optional[list[FileChange]] = None) -> None:
         history = self.get_history(modpack_name)
@@ -60,16 +160,39 @@ class SyncHistoryStore:
 
     def save_history(self, history: SyncHistory) -> None:
         with self._lock:
+            self._cache[history.modpack_name] = history
+            self._dirty = True
+
+    def _schedule_flush(self) -> None:
+        """Arrange a flush shortly after the last mutation settles."""
+
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Persist all pending changes to disk in a single write."""
+
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
             raw = self._read_raw()
-            raw[history.modpack_name] = {
-                "files": history.files,
-                "exclusions": history.exclusions,
-                "last_synced": history.last_synced,
-            }
+            for history in self._cache.values():
+                raw[history.modpack_name] = {
+                    "files": history.files,
+                    "exclusions": history.exclusions,
+                    "last_synced": history.last_synced,
+                }
             self._write_raw(raw)
-            self._cache[history.modpack_name] = history
+            self._dirty = False
 
-    def update_file_snapshot(self, modpack_name: str, snapshot: Dict[str, Dict[str, str]]) -> None:
+    def update_file_snapshot(self, modpack_name: str, snapshot: Dict[str, Dict]) -> None:
         history = self.get_history(modpack_name)
         history.files = snapshot
         history.last_synced = time.time()
@@ -80,9 +203,11 @@ class SyncHistoryStore:
         if relative_path not in history.exclusions:
             history.exclusions.append(relative_path)
             self.save_history(history)
+            self._schedule_flush()
 
     def remove_exclusion(self, modpack_name: str, relative_path: str) -> None:
         history = self.get_history(modpack_name)
         if relative_path in history.exclusions:
             history.exclusions.remove(relative_path)
             self.save_history(history)
+            self._schedule_flush()
@@ -2,80 +2,281 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import AbstractSet, Dict, Iterable, List, Optional, Set, Tuple
 import os
+import stat as stat_module
 
 from .models import FileAction, FileChange, ModpackInfo, SyncPlan
 from .persistence import SyncHistoryStore
 from ..utils import filesystem
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotEntry:
-    """Metadata describing a file captured during scanning."""
+    """Metadata describing a file captured during scanning.
+
+    ``hash_digest`` may be ``None`` when the snapshot was gathered without
+    hashing; use :func:`_ensure_hash` to fill it on demand.
+    """
 
     relative_path: Path
     absolute_path: Path
     size: int
     mtime: float
-    hash_digest: str
+    hash_digest: Optional[str] = None
+
+
+def _ensure_hash(entry: SnapshotEntry) -> str:
+    """Return the entry's digest, computing and caching it if missing."""
+
+    if entry.hash_digest is None:
+        entry.hash_digest = filesystem.hash_file(entry.absolute_path)
+    return entry.hash_digest
 
 
 def discover_modpacks(instances_path: Path) -> list[ModpackInfo]:
-    """Find potential modpacks inside the CurseForge instances directory."""
+    """Find potential modpacks inside the CurseForge instances directory.
+
+    Each candidate directory is inspected with a single ``scandir`` listing,
+    so checking for the manifest, mods folder, and icon candidates costs one
+    syscall instead of one stat per probed name.
+    """
 
     if not instances_path.exists():
         return []
 
-    modpacks: list[ModpackInfo] = []
-    for entry in sorted(instances_path.iterdir()):
-        if not entry.is_dir():
+    try:
+        with os.scandir(instances_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return []
+
+    candidates = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    if not candidates:
+        return []
+
+    def inspect(entry: os.DirEntry) -> Optional[ModpackInfo]:
+        try:
+            with os.scandir(entry.path) as child_it:
+                children = {child.name for child in child_it}
+        except OSError:
+            return None
+
+        has_manifest = "manifest.json" in children
+        if not has_manifest and "mods" not in children:
+            return None
+        pack_path = Path(entry.path)
+        icon_name = next((name for name in ("icon.png", "pack.png") if name in children), None)
+        return ModpackInfo(
+            name=entry.name,
+            path=pack_path,
+            icon_path=pack_path / icon_name if icon_name else None,
+            manifest_path=pack_path / "manifest.json" if has_manifest else None,
+        )
+
+    # Candidate listings are independent; overlapping them turns serial
+    # per-directory latency into roughly the slowest one, which matters most
+    # on network-mounted instance directories. executor.map keeps the sorted
+    # order.
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+        return [info for info in executor.map(inspect, candidates) if info is not None]
+
+
+# Hashing is dominated by disk reads and hashlib releases the GIL in its C
+# code, so a generous thread count keeps the disk queue full.
+_HASH_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Tiny config files cost more in executor scheduling than in hashing, so
+# they are submitted to the pool in batches of this many paths.
+_SMALL_FILE_BATCH = 64
+
+
+def _hash_batch(paths: List[Path]) -> List[str]:
+    """Hash a batch of small files in one pool task."""
+
+    return [filesystem.hash_file(path) for path in paths]
+
+
+# history.files payload: relative path -> {"hash", "algo", "size", "mtime"}.
+# Sizes and mtimes are stored natively (int/float); str values from older
+# history files are still accepted on read.
+SnapshotPayload = Dict[str, Dict[str, object]]
+
+
+def _cached_digest(prior_entry: Optional[Dict[str, object]], stat_info: os.stat_result) -> Optional[str]:
+    """Return the previously recorded hash if size and mtime are unchanged."""
+
+    if not prior_entry:
+        return None
+    # Digests recorded under a different algorithm must be recomputed once.
+    if prior_entry.get("algo", "sha256") != filesystem.HASH_ALGO:
+        return None
+    size, mtime = prior_entry.get("size"), prior_entry.get("mtime")
+    if isinstance(size, str):  # legacy stringified schema
+        size, mtime = int(size), float(mtime)
+    if size == stat_info.st_size and mtime == stat_info.st_mtime:
+        digest = prior_entry.get("hash")
+        return digest if isinstance(digest, str) and digest else None
+    return None
+
+
+def _iter_files(base_path: Path) -> Iterable[os.DirEntry]:
+    """Yield directory entries for every regular file under a base path.
+
+    Built on ``os.scandir`` so file type and stat information come from the
+    directory listing itself instead of one extra stat syscall per file.
+    """
+
+    stack = [str(base_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
             continue
-        manifest = entry / "manifest.json"
-        mods_dir = entry / "mods"
-
-        if manifest.exists() or mods_dir.exists():
-            icon_path = next((entry / name for name in ("icon.png", "pack.png") if (entry / name).exists()), None)
-            modpacks.append(
-                ModpackInfo(
-                    name=entry.name,
-                    path=entry,
-                    icon_path=icon_path,
-                    manifest_path=manifest if manifest.exists() else None,
-                )
-            )
 
-    return modpacks
 
+# fwalk hands out a directory fd per level, letting each stat resolve a
+# single name instead of re-walking the whole path — relevant for deep
+# modpack trees. Not every platform supports dir_fd (notably Windows).
+_HAS_DIR_FD = os.stat in os.supports_dir_fd
+
+
+def _iter_stats(base_path: Path) -> Iterable[Tuple[str, os.stat_result]]:
+    """Yield ``(absolute_path, stat_result)`` for regular files under a base.
+
+    Uses ``os.fwalk`` with ``dir_fd``-relative stats where supported so path
+    resolution stays O(1) per file regardless of tree depth; otherwise falls
+    back to the scandir walker, whose entries carry cached stat data.
+    """
+
+    if _HAS_DIR_FD:
+        for root, _, files, dirfd in os.fwalk(str(base_path), follow_symlinks=False):
+            prefix = root + os.sep
+            for name in files:
+                try:
+                    stat_info = os.stat(name, dir_fd=dirfd, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat_module.S_ISREG(stat_info.st_mode):
+                    yield prefix + name, stat_info
+        return
+
+    for entry in _iter_files(base_path):
+        try:
+            yield entry.path, entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
 
-def _gather_snapshot(base_path: Path, exclusions: Iterable[str]) -> Dict[Path, SnapshotEntry]:
-    """Collect metadata for files under a base path."""
 
-    normalized_exclusions = {filesystem.normalize_relative(exclusion) for exclusion in exclusions}
-    snapshot: Dict[Path, SnapshotEntry] = {}
+def _gather_snapshot(
+    base_path: Path,
+    exclusions: AbstractSet[str] = frozenset(),
+    prior: Optional[SnapshotPayload] = None,
+    compute_hashes: bool = True,
+) -> Dict[str, SnapshotEntry]:
+    """Collect metadata for files under a base path, keyed by normalized
+    relative path.
+
+    ``exclusions`` must already be a set of normalized relative paths —
+    callers build it once instead of re-normalizing per scan. ``prior`` is
+    the ``history.files`` payload from the last sync; when a file's size and
+    mtime still match the recorded values its stored hash is reused instead
+    of re-reading the file. With ``compute_hashes=False``, files missing
+    from the cache are left with ``hash_digest=None`` so callers can hash
+    only the ones they actually need to compare.
+    """
+
+    snapshot: Dict[str, SnapshotEntry] = {}
+    prior = prior or {}
 
     if not base_path.exists():
         return snapshot
 
-    for root, _, files in os.walk(base_path):
-        root_path = Path(root)
-        for filename in files:
-            abs_path = root_path / filename
-            rel_path = abs_path.relative_to(base_path)
-            norm_rel = filesystem.normalize_relative(str(rel_path))
-            if norm_rel in normalized_exclusions:
+    # Relative paths are derived by slicing off the base prefix, which is
+    # much cheaper than Path.relative_to per file.
+    base_len = len(str(base_path)) + 1
+
+    if not compute_hashes:
+        for abs_str, stat_info in _iter_stats(base_path):
+            rel_str = abs_str[base_len:]
+            norm_rel = rel_str.replace("\\", "/")
+            if exclusions and norm_rel in exclusions:
+                continue
+            snapshot[norm_rel] = SnapshotEntry(
+                relative_path=Path(rel_str),
+                absolute_path=Path(abs_str),
+                size=stat_info.st_size,
+                mtime=stat_info.st_mtime,
+                hash_digest=_cached_digest(prior.get(norm_rel), stat_info),
+            )
+        return snapshot
+
+    # Hash work is submitted while the walk is still running, so stat-bound
+    # directory traversal overlaps hash-bound file reads and the wall time
+    # approaches max(walk, hash) rather than their sum. Large files get a
+    # pool task each; small ones are batched so per-task dispatch overhead
+    # does not dominate their hashing cost. Cached hashes are reused for
+    # files whose stat signature is unchanged.
+    big: List[Tuple[str, str, str, os.stat_result]] = []
+    small: List[Tuple[str, str, str, os.stat_result]] = []
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        big_futures = []
+        batch_futures = []
+        small_batch: List[Tuple[str, str, str, os.stat_result]] = []
+        for abs_str, stat_info in _iter_stats(base_path):
+            rel_str = abs_str[base_len:]
+            norm_rel = rel_str.replace("\\", "/")
+            if exclusions and norm_rel in exclusions:
                 continue
-            try:
-                stat_info = abs_path.stat()
-            except OSError:
+
+            cached = _cached_digest(prior.get(norm_rel), stat_info)
+            if cached is not None:
+                snapshot[norm_rel] = SnapshotEntry(
+                    relative_path=Path(rel_str),
+                    absolute_path=Path(abs_str),
+                    size=stat_info.st_size,
+                    mtime=stat_info.st_mtime,
+                    hash_digest=cached,
+                )
                 continue
 
-            hash_digest = filesystem.hash_file(abs_path)
-            snapshot[rel_path] = SnapshotEntry(
-                relative_path=rel_path,
-                absolute_path=abs_path,
+            item = (abs_str, norm_rel, rel_str, stat_info)
+            if stat_info.st_size > filesystem.MMAP_THRESHOLD:
+                big.append(item)
+                big_futures.append(executor.submit(filesystem.hash_file, Path(abs_str)))
+            else:
+                small_batch.append(item)
+                if len(small_batch) >= _SMALL_FILE_BATCH:
+                    small.extend(small_batch)
+                    batch_futures.append(
+                        executor.submit(_hash_batch, [Path(p) for p, _, _, _ in small_batch])
+                    )
+                    small_batch = []
+        if small_batch:
+            small.extend(small_batch)
+            batch_futures.append(
+                executor.submit(_hash_batch, [Path(p) for p, _, _, _ in small_batch])
+            )
+
+        # Futures were appended in discovery order, so pairing them back up
+        # is a straight zip.
+        results = chain(
+            zip(big, (future.result() for future in big_futures)),
+            zip(small, chain.from_iterable(future.result() for future in batch_futures)),
+        )
+        for (abs_str, norm_rel, rel_str, stat_info), hash_digest in results:
+            snapshot[norm_rel] = SnapshotEntry(
+                relative_path=Path(rel_str),
+                absolute_path=Path(abs_str),
                 size=stat_info.st_size,
                 mtime=stat_info.st_mtime,
                 hash_digest=hash_digest,
@@ -88,10 +289,19 @@ def build_sync_plan(
     modpack: ModpackInfo,
     target_path: Path,
     history_store: SyncHistoryStore,
-) -> Tuple[SyncPlan, Dict[str, Dict[str, str]], Dict[Path, SnapshotEntry], Dict[Path, SnapshotEntry]]:
+) -> Tuple[
+    SyncPlan,
+    SnapshotPayload,
+    Dict[str, SnapshotEntry],
+    Dict[str, SnapshotEntry],
+    Set[str],
+    Set[str],
+]:
     """Generate a synchronization plan for the given modpack.
 
-    Returns the plan, the new snapshot payload, and the raw source/target snapshots.
+    Returns the plan, the new snapshot payload, the raw source/target
+    snapshots, and sets of absolute source/target paths known to exist so
+    the executor can skip per-file exists() syscalls.
     """
     
     # Validate inputs
@@ -100,22 +310,44 @@ def build_sync_plan(
 
     plan = SyncPlan()
     history = history_store.get_history(modpack.name)
-    exclusions = history.exclusions
-
-    source_snapshot = _gather_snapshot(modpack.path, exclusions)
-    target_snapshot = _gather_snapshot(target_path, [])
-
-    history_files = {Path(k): v for k, v in history.files.items()}
+    exclusions = frozenset(
+        filesystem.normalize_relative(exclusion) for exclusion in history.exclusions
+    )
+
+    # The last synced snapshot doubles as a hash cache for both sides:
+    # copy_file preserves mtimes, so an untouched target file carries the
+    # same stat signature that was recorded for its source. Target hashes
+    # are only needed when a size comparison cannot already prove
+    # inequality, so defer them until the diff below asks. The two scans
+    # touch independent trees, so they run concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(
+            _gather_snapshot, modpack.path, exclusions, prior=history.files
+        )
+        target_future = executor.submit(
+            _gather_snapshot, target_path, prior=history.files, compute_hashes=False
+        )
+        source_snapshot = source_future.result()
+        target_snapshot = target_future.result()
+
+    # Normalize history keys on the way in: older histories written on
+    # Windows are keyed with backslashes, and the snapshot keys they are
+    # diffed against below are always forward-slash form. Without this a
+    # legacy entry never matches its still-present file and gets planned
+    # as a removal.
+    history_files = {
+        filesystem.normalize_relative(rel_str): info for rel_str, info in history.files.items()
+    }
 
     # Determine additions and updates
-    for rel_path, source_entry in source_snapshot.items():
-        target_entry = target_snapshot.get(rel_path)
+    for rel_str, source_entry in source_snapshot.items():
+        target_entry = target_snapshot.get(rel_str)
 
         change = FileChange(
-            relative_path=rel_path,
+            relative_path=source_entry.relative_path,
             action=FileAction.COPY,
             source_path=source_entry.absolute_path,
-            target_path=target_path / rel_path,
+            target_path=target_path / rel_str,
             size_bytes=source_entry.size,
             hash_digest=source_entry.hash_digest,
         )
@@ -123,7 +355,12 @@ def build_sync_plan(
         if target_entry is None:
             plan.adds.append(change)
         else:
-            if target_entry.hash_digest != source_entry.hash_digest:
+            if target_entry.size != source_entry.size:
+                # Different sizes guarantee different content; skip hashing.
+                change.action = FileAction.UPDATE
+                change.reason = "Size differs"
+                plan.updates.append(change)
+            elif _ensure_hash(target_entry) != source_entry.hash_digest:
                 change.action = FileAction.UPDATE
                 change.reason = "Content differs"
                 plan.updates.append(change)
@@ -133,14 +370,15 @@ def build_sync_plan(
                 plan.skipped.append(change)
 
         # Remove from history tracking to keep track of potential deletions later
-        history_files.pop(rel_path, None)
+        history_files.pop(rel_str, None)
 
     # Determine removals based on history (files previously synced but no longer present)
-    for rel_path, info in history_files.items():
-        target_entry = target_snapshot.get(rel_path)
-        target_abs = target_path / rel_path
+    for rel_str, info in history_files.items():
+        target_entry = target_snapshot.get(rel_str)
+        target_abs = target_path / rel_str
+        rel_path = Path(rel_str)
 
-        if info.get("hash") and target_entry and target_entry.hash_digest != info.get("hash"):
+        if info.get("hash") and target_entry and _ensure_hash(target_entry) != info.get("hash"):
             # The target file has drifted; treat as update instead of deletion
             plan.updates.append(
                 FileChange(
@@ -163,13 +401,17 @@ def build_sync_plan(
                 )
             )
 
-    snapshot_payload = {
-        str(rel_path): {
+    snapshot_payload: SnapshotPayload = {
+        rel_str: {
             "hash": entry.hash_digest,
-            "size": str(entry.size),
-            "mtime": str(entry.mtime),
+            "algo": filesystem.HASH_ALGO,
+            "size": entry.size,
+            "mtime": entry.mtime,
         }
-        for rel_path, entry in source_snapshot.items()
+        for rel_str, entry in source_snapshot.items()
     }
 
-    return plan, snapshot_payload, source_snapshot, target_snapshot
+    existing_sources = {str(entry.absolute_path) for entry in source_snapshot.values()}
+    existing_targets = {str(entry.absolute_path) for entry in target_snapshot.values()}
+
+    return plan, snapshot_payload, source_snapshot, target_snapshot, existing_sources, existing_targets
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import logging
 
 from .config import AppConfig, ConfigManager
@@ -17,10 +18,27 @@ logger = logging.getLogger(__name__)
 
 
 ConfirmationCallback = Callable[[FileChange], bool]
-ProgressCallback = Callable[[str, int, int], None]  # message, current, total
+# message, completed, total. Units are byte-weighted: each change counts for
+# its file size plus one, so the bar tracks data moved rather than file count
+# and big archives no longer freeze it at one tick. Callers should rescale
+# totals that exceed their widget's integer range.
+ProgressCallback = Callable[[str, int, int], None]
 LogCallback = Callable[[str], None]
 
 
+# Copies are latency-bound on open/close of many small files; a modest pool
+# keeps the storage queue busy without thrashing spinning disks.
+_COPY_WORKERS = 8
+
+
+def _path_exists(path: Path, known: Optional[Set[str]]) -> bool:
+    """Check existence against a pre-scanned set, falling back to a stat."""
+
+    if known is not None:
+        return str(path) in known
+    return path.exists()
+
+
 class SyncEngine:
     """High-level controller handling discovery, planning, and execution."""
 
@@ -52,7 +70,7 @@ class SyncEngine:
         return discover_modpacks(instances_path)
 
     # Planning -------------------------------------------------------------------
-    def create_sync_plan(self, modpack: ModpackInfo) -> tuple[SyncPlan, dict, dict, dict]:
+    def create_sync_plan(self, modpack: ModpackInfo) -> tuple[SyncPlan, dict, dict, dict, set, set]:
         target_path = self.config.game_path
         return build_sync_plan(modpack, target_path, self.history_store)
 
@@ -68,8 +86,15 @@ class SyncEngine:
         confirm_update: Optional[ConfirmationCallback] = None,
         confirm_removal: Optional[ConfirmationCallback] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        existing_sources: Optional[Set[str]] = None,
+        existing_targets: Optional[Set[str]] = None,
     ) -> None:
-        """Apply a sync plan with optional confirmation callbacks."""
+        """Apply a sync plan with optional confirmation callbacks.
+
+        ``existing_sources``/``existing_targets`` are the path sets returned
+        by ``build_sync_plan``; when provided, existence checks consult them
+        instead of issuing one stat syscall per file.
+        """
 
         target_path = self.config.game_path
 
@@ -85,8 +110,22 @@ class SyncEngine:
         elif not target_path.is_dir():
             raise ValueError(f"Target game path is not a directory: {target_path}")
         backup_root = self.config.backup_dir if create_backups else None
+        # One timestamped directory per run: the stamp and mkdir happen once
+        # and relative layouts are preserved, so same-named files in
+        # different folders cannot collide.
+        backup_session = filesystem.BackupSession(backup_root) if backup_root else None
 
-        total_items = len(plan.adds) + len(plan.updates) + len(plan.removals)
+        # Progress is weighted by size so one large archive does not stall
+        # the bar behind hundreds of tiny configs; +1 keeps empty files and
+        # removals visible.
+        def weight_of(change: FileChange) -> int:
+            return (change.size_bytes or 0) + 1
+
+        total_weight = sum(
+            weight_of(change)
+            for bucket in (plan.adds, plan.updates, plan.removals)
+            for change in bucket
+        )
         processed = 0
 
         auto_confirm_updates = (
@@ -96,26 +135,29 @@ class SyncEngine:
             self.config.auto_confirm_removals if auto_confirm_removals is None else auto_confirm_removals
         )
 
-        def tick(message: str) -> None:
+        def tick(message: str, change: Optional[FileChange] = None) -> None:
             nonlocal processed
-            processed += 1
+            processed += weight_of(change) if change is not None else 1
             if progress_callback:
-                progress_callback(message, processed, total_items)
+                progress_callback(message, processed, total_weight)
+
+        # Gather all approved copies first, then execute them concurrently;
+        # each copy is latency-bound so a pool overlaps open/read/write of
+        # many files. Confirmations and progress stay on the calling thread.
+        copy_batch: List[Tuple[FileChange, Path, Path, bool]] = []
 
         for change in plan.adds:
             destination = change.target_path or (target_path / change.relative_path)
-            if destination.exists():
+            if _path_exists(destination, existing_targets):
                 # Treat as update if somehow already exists
                 change.action = FileAction.UPDATE
                 plan.updates.append(change)
                 continue
             source_path = change.source_path
-            if not source_path or not source_path.exists():
+            if not source_path or not _path_exists(source_path, existing_sources):
                 self._log(f"Source missing for {change.relative_path}, skipping")
                 continue
-            filesystem.copy_file(source_path, destination)
-            self._log(f"Copied {change.relative_path}")
-            tick(f"Copied {change.relative_path}")
+            copy_batch.append((change, source_path, destination, False))
 
         for change in list(plan.updates):
             destination = change.target_path or (target_path / change.relative_path)
@@ -126,21 +168,81 @@ class SyncEngine:
                 if not allowed:
                     plan.skipped.append(change)
                     self._log(f"Skipped update for {change.relative_path}")
-                    tick(f"Skipped {change.relative_path}")
+                    tick(f"Skipped {change.relative_path}", change)
                     continue
 
-            if source_path and source_path.exists():
-                if backup_root and destination.exists():
-                    filesystem.create_backup(destination, backup_root)
-                filesystem.copy_file(source_path, destination)
-                self._log(f"Updated {change.relative_path}")
+            if source_path and _path_exists(source_path, existing_sources):
+                needs_backup = bool(backup_root) and _path_exists(destination, existing_targets)
+                copy_batch.append((change, source_path, destination, needs_backup))
             else:
                 self._log(f"Target changed externally: {change.relative_path}")
-            tick(f"Updated {change.relative_path}")
+                tick(f"Updated {change.relative_path}", change)
+
+        if copy_batch:
+            # Identical content already present in the target tree is
+            # hardlinked instead of rewritten. In-sync files seed the digest
+            # index (their target content is verified equal this run) and
+            # every finished copy joins it, so renamed or duplicated
+            # archives cost a link() instead of a second full write.
+            known_hashes: Dict[str, Path] = {
+                change.hash_digest: change.target_path
+                for change in plan.skipped
+                if change.action == FileAction.SKIP and change.hash_digest and change.target_path
+            }
+            # Create every destination directory once, shallow to deep, so
+            # the pooled copies skip their per-file mkdir(exist_ok=True)
+            # syscall — on a fresh install that is one mkdir per directory
+            # instead of one per file.
+            dirs_needed = {destination.parent for _, _, destination, _ in copy_batch}
+            for directory in sorted(dirs_needed, key=lambda p: len(p.parts)):
+                directory.mkdir(parents=True, exist_ok=True)
+            # One full copy per digest: the first file of each new digest is
+            # a primary; same-content followers run in a second wave, after
+            # every primary has registered its destination, so they hardlink
+            # instead of copying. Without the split, identical files
+            # submitted together all miss the index while in flight and the
+            # duplicated-jar case never dedups.
+            seen_digests: Set[str] = set()
+            primaries: List[Tuple[FileChange, Path, Path, bool]] = []
+            followers: List[Tuple[FileChange, Path, Path, bool]] = []
+            for item in copy_batch:
+                digest = item[0].hash_digest
+                if digest and (digest in known_hashes or digest in seen_digests):
+                    followers.append(item)
+                    continue
+                if digest:
+                    seen_digests.add(digest)
+                primaries.append(item)
+            with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+                for wave in (primaries, followers):
+                    futures = {}
+                    for change, source_path, destination, needs_backup in wave:
+                        if needs_backup and backup_session:
+                            backup_session.add(destination, change.relative_path)
+                        future = executor.submit(
+                            filesystem.copy_file_dedup,
+                            source_path,
+                            destination,
+                            change.hash_digest,
+                            known_hashes,
+                            make_parents=False,
+                        )
+                        futures[future] = (change, destination)
+                    for future in as_completed(futures):
+                        change, destination = futures[future]
+                        future.result()
+                        if change.hash_digest:
+                            known_hashes.setdefault(change.hash_digest, destination)
+                        if existing_targets is not None:
+                            existing_targets.add(str(destination))
+                        verb = "Updated" if change.action == FileAction.UPDATE else "Copied"
+                        self._log(f"{verb} {change.relative_path}")
+                        tick(f"{verb} {change.relative_path}", change)
 
+        removed_parents: Set[Path] = set()
         for change in plan.removals:
             destination = change.target_path or (target_path / change.relative_path)
-            if not destination.exists():
+            if not _path_exists(destination, existing_targets):
                 continue
 
             if not auto_confirm_removals:
@@ -148,17 +250,22 @@ class SyncEngine:
                 if not allowed:
                     plan.skipped.append(change)
                     self._log(f"Kept {change.relative_path}")
-                    tick(f"Kept {change.relative_path}")
+                    tick(f"Kept {change.relative_path}", change)
                     continue
 
-            if backup_root:
-                filesystem.create_backup(destination, backup_root)
+            if backup_session:
+                backup_session.add(destination, change.relative_path)
             filesystem.remove_file(destination)
+            removed_parents.add(destination.parent)
+            if existing_targets is not None:
+                existing_targets.discard(str(destination))
             self._log(f"Removed {change.relative_path}")
-            tick(f"Removed {change.relative_path}")
+            tick(f"Removed {change.relative_path}", change)
 
         self.history_store.update_file_snapshot(modpack.name, snapshot_payload)
-        filesystem.prune_empty_dirs(self.config.game_path)
+        self.history_store.flush()
+        # Only directories that just lost files can have become empty.
+        filesystem.prune_empty_dirs(self.config.game_path, removed_parents)
 
     # Exclusions -----------------------------------------------------------------
     def add_exclusion(self, modpack_name: str, relative_path: str) -> None:
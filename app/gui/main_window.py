@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import time
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from ..core.config import ConfigManager
-from ..core.models import FileChange, ModpackInfo, SyncPlan
-from ..core.syncer import SyncEngine
+from ..core.models import FileAction, FileChange, ModpackInfo, SyncPlan
+from ..core.syncer import ConfirmationCallback, SyncEngine
 
 
 # Modern color scheme
@@ -29,9 +32,9 @@ COLORS = {
 }
 
 
-def get_modern_stylesheet() -> str:
-    """Return a modern stylesheet for the application."""
-    return f"""
+# Built once at import: the f-string interpolation and Qt's (slow) CSS parse
+# both key off this exact string, so every window shares one copy.
+_MODERN_STYLESHEET = f"""
         QMainWindow {{
             background-color: {COLORS['background']};
             color: {COLORS['text_primary']};
@@ -147,7 +150,7 @@ def get_modern_stylesheet() -> str:
             background-color: {COLORS['hover']};
         }}
 
-        QTreeWidget {{
+        QTreeView {{
             border: 1px solid {COLORS['border']};
             border-radius: 8px;
             background-color: {COLORS['surface']};
@@ -155,17 +158,17 @@ def get_modern_stylesheet() -> str:
             font-size: 12px;
         }}
 
-        QTreeWidget::item {{
+        QTreeView::item {{
             padding: 6px;
             border-radius: 4px;
         }}
 
-        QTreeWidget::item:selected {{
+        QTreeView::item:selected {{
             background-color: {COLORS['primary_dark']};
             color: {COLORS['text_primary']};
         }}
 
-        QTreeWidget::item:hover {{
+        QTreeView::item:hover {{
             background-color: {COLORS['hover']};
         }}
 
@@ -305,34 +308,518 @@ def get_modern_stylesheet() -> str:
     """
 
 
+# Per-widget stylesheet fragments, also interpolated once at import so
+# repeated window construction re-parses nothing.
+_TITLE_QSS = f"""
+    font-size: 24px;
+    font-weight: bold;
+    color: {COLORS['primary']};
+    padding: 10px;
+"""
+
+_LABEL_BOLD_QSS = f"font-weight: 600; color: {COLORS['text_primary']};"
+
+_SAVE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {COLORS['success']};
+        color: #0D1B0E;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background-color: #57A75F;
+    }}
+"""
+
+_DETAILS_QSS = f"""
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 6px;
+    padding: 10px;
+    font-size: 11px;
+    color: {COLORS['text_secondary']};
+"""
+
+_CHECKBOX_QSS = "font-weight: 500;"
+
+_STATUS_SUCCESS_QSS = f"font-weight: 500; color: {COLORS['success']};"
+_STATUS_INFO_QSS = f"font-weight: 500; color: {COLORS['primary']};"
+_STATUS_ERROR_QSS = f"font-weight: 500; color: {COLORS['danger']};"
+
+# Fixed-prefix templates for frequently rebuilt strings.
+_STATUS_TMPL = "{icon} {msg}"
+_MODPACK_ITEM_TMPL = "📦 {name}"
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Shared per-category paint objects; QColor parsing and brush construction
+# are not free, so build them once instead of per preview row.
+_CATEGORY_BRUSHES = {
+    "Add": QtGui.QBrush(QtGui.QColor(COLORS["success"])),
+    "Update": QtGui.QBrush(QtGui.QColor(COLORS["warning"])),
+    "Remove": QtGui.QBrush(QtGui.QColor(COLORS["danger"])),
+    "Skip": QtGui.QBrush(QtGui.QColor(COLORS["text_secondary"])),
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_size(size: int) -> str:
+    """Format file size in a human-readable format.
+
+    Pure and frequently fed duplicate sizes (re-downloads of the same jars),
+    so repeated calls become cache hits.
+    """
+    if size < 1024:
+        return f"{size} B"
+    # bit_length picks the unit directly: every 10 bits is one 1024 step.
+    idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
+
+
+def get_modern_stylesheet() -> str:
+    """Return a modern stylesheet for the application."""
+    return _MODERN_STYLESHEET
+
+
+# Hot Qt enum values interned once; resolving e.g.
+# QtCore.Qt.ItemDataRole.DisplayRole is three dict lookups, and the model's
+# data() pays that per cell per repaint otherwise.
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_FOREGROUND_ROLE = QtCore.Qt.ItemDataRole.ForegroundRole
+_FONT_ROLE = QtCore.Qt.ItemDataRole.FontRole
+_USER_ROLE = QtCore.Qt.ItemDataRole.UserRole
+_MB_YES = QtWidgets.QMessageBox.StandardButton.Yes
+_MB_NO = QtWidgets.QMessageBox.StandardButton.No
+
+_CATEGORY_NAMES = ("Add", "Update", "Remove", "Skip")
+_CATEGORY_LABELS = ("➕ Add", "🔄 Update", "🗑️ Remove", "⏭️ Skip")
+
+
+class SyncPlanModel(QtCore.QAbstractTableModel):
+    """Flat table model over a sync plan's changes.
+
+    Rows are ``(category_index, FileChange)`` tuples rendered on demand, so
+    populating a preview is a single model reset instead of one
+    QTreeWidgetItem (and its per-cell QVariant storage) per change.
+    """
+
+    HEADERS = ("Action", "Relative Path", "Size", "Details")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[int, FileChange]] = []
+        self._bold_font = QtGui.QFont()
+        self._bold_font.setBold(True)
+
+    def set_plan(self, plan: Optional[SyncPlan]) -> None:
+        """Replace the displayed plan in one reset."""
+        self.beginResetModel()
+        self._rows = []
+        if plan is not None:
+            categories = (plan.adds, plan.updates, plan.removals, plan.skipped)
+            for category, changes in enumerate(categories):
+                self._rows.extend((category, change) for change in changes)
+        self.endResetModel()
+
+    def change_at(self, row: int) -> Optional[FileChange]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][1]
+        return None
+
+    # Qt model interface ---------------------------------------------------
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = 0):
+        if (
+            role == _DISPLAY_ROLE
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role: int = 0):
+        if not index.isValid():
+            return None
+        category, change = self._rows[index.row()]
+        column = index.column()
+
+        if role == _DISPLAY_ROLE:
+            if column == 0:
+                return _CATEGORY_LABELS[category]
+            if column == 1:
+                return change.relative_path.as_posix()
+            if column == 2:
+                return _format_size(change.size_bytes) if change.size_bytes is not None else ""
+            return change.reason or ""
+        if role == _FOREGROUND_ROLE:
+            return _CATEGORY_BRUSHES[_CATEGORY_NAMES[category]]
+        if role == _FONT_ROLE and column == 0:
+            return self._bold_font
+        if role == _USER_ROLE:
+            return change
+        return None
+
+
+class _PlanWorkerSignals(QtCore.QObject):
+    """Signals for marshalling plan results back to the GUI thread."""
+
+    finished = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(str)
+
+
+class _PlanWorker(QtCore.QRunnable):
+    """Run SyncEngine.create_sync_plan on a pool thread.
+
+    ``modpack`` stays public so result handlers can check that a finished
+    plan still matches the current selection before adopting it.
+    """
+
+    def __init__(self, engine: SyncEngine, modpack: ModpackInfo) -> None:
+        super().__init__()
+        self.signals = _PlanWorkerSignals()
+        self.modpack = modpack
+        self._engine = engine
+
+    def run(self) -> None:
+        try:
+            result = self._engine.create_sync_plan(self.modpack)
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+        else:
+            self.signals.finished.emit(result)
+
+
+class _RefreshWorkerSignals(QtCore.QObject):
+    """Signals for marshalling modpack discovery results back to the GUI."""
+
+    finished = QtCore.pyqtSignal(object)
+    error = QtCore.pyqtSignal(str)
+
+
+class _RefreshWorker(QtCore.QRunnable):
+    """Run SyncEngine.list_modpacks on a pool thread.
+
+    Pool threads are reused across clicks, avoiding the create/teardown
+    cost of a dedicated QThread per refresh.
+    """
+
+    def __init__(self, engine: SyncEngine) -> None:
+        super().__init__()
+        self.signals = _RefreshWorkerSignals()
+        self._engine = engine
+
+    def run(self) -> None:
+        try:
+            result = self._engine.list_modpacks()
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+        else:
+            self.signals.finished.emit(result)
+
+
+class ConfirmChangesDialog(QtWidgets.QDialog):
+    """Collect every update/removal confirmation in one dialog.
+
+    Popping a modal question per conflicting file serializes the engine
+    behind user input; deciding everything up front lets execution run
+    uninterrupted. All rows start checked — unchecking keeps that file
+    as it is.
+    """
+
+    def __init__(
+        self,
+        updates: list[FileChange],
+        removals: list[FileChange],
+        parent: Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Confirm Changes")
+        self.resize(560, 480)
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self._update_list = self._build_section(
+            layout, "Files to update (replace existing):", updates
+        )
+        self._removal_list = self._build_section(
+            layout, "Files to remove from the game directory:", removals
+        )
+
+        toggle_row = QtWidgets.QHBoxLayout()
+        accept_all_btn = QtWidgets.QPushButton("Accept All", self)
+        accept_all_btn.clicked.connect(lambda: self._set_all(QtCore.Qt.CheckState.Checked))
+        reject_all_btn = QtWidgets.QPushButton("Reject All", self)
+        reject_all_btn.clicked.connect(lambda: self._set_all(QtCore.Qt.CheckState.Unchecked))
+        toggle_row.addWidget(accept_all_btn)
+        toggle_row.addWidget(reject_all_btn)
+        toggle_row.addStretch(1)
+        layout.addLayout(toggle_row)
+
+        self._dont_ask_checkbox = QtWidgets.QCheckBox(
+            "Don't ask again this session (accept all future changes)", self
+        )
+        layout.addWidget(self._dont_ask_checkbox)
+
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Ok
+            | QtWidgets.QDialogButtonBox.StandardButton.Cancel,
+            parent=self,
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _build_section(
+        self,
+        layout: QtWidgets.QVBoxLayout,
+        title: str,
+        changes: list[FileChange],
+    ) -> Optional[QtWidgets.QListWidget]:
+        if not changes:
+            return None
+        label = QtWidgets.QLabel(title, self)
+        label.setStyleSheet(_LABEL_BOLD_QSS)
+        layout.addWidget(label)
+        file_list = QtWidgets.QListWidget(self)
+        file_list.setUniformItemSizes(True)
+        file_list.setUpdatesEnabled(False)
+        for change in changes:
+            item = QtWidgets.QListWidgetItem(change.relative_path.as_posix())
+            item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.CheckState.Checked)
+            file_list.addItem(item)
+        file_list.setUpdatesEnabled(True)
+        layout.addWidget(file_list, stretch=1)
+        return file_list
+
+    def _set_all(self, state: QtCore.Qt.CheckState) -> None:
+        for file_list in (self._update_list, self._removal_list):
+            if file_list is None:
+                continue
+            for row in range(file_list.count()):
+                file_list.item(row).setCheckState(state)
+
+    @staticmethod
+    def _checked_paths(file_list: Optional[QtWidgets.QListWidget]) -> set[str]:
+        if file_list is None:
+            return set()
+        return {
+            file_list.item(row).text()
+            for row in range(file_list.count())
+            if file_list.item(row).checkState() == QtCore.Qt.CheckState.Checked
+        }
+
+    def accepted_updates(self) -> set[str]:
+        return self._checked_paths(self._update_list)
+
+    def accepted_removals(self) -> set[str]:
+        return self._checked_paths(self._removal_list)
+
+    def dont_ask_again(self) -> bool:
+        return self._dont_ask_checkbox.isChecked()
+
+
+class _ConfirmSink:
+    """One confirmation verdict travelling from the GUI to a waiting worker.
+
+    The sink rides inside the signal payload, so each request owns its
+    semaphore outright — no shared registry to lock or key.
+    """
+
+    __slots__ = ("semaphore", "allowed")
+
+    def __init__(self) -> None:
+        self.semaphore = QtCore.QSemaphore(0)
+        self.allowed = False
+
+    def resolve(self, allowed: bool) -> None:
+        self.allowed = allowed
+        self.semaphore.release()
+
+
+class SyncWorker(QtCore.QObject):
+    """Run SyncEngine.execute_plan on a dedicated thread.
+
+    Progress and completion are emitted as signals, which Qt delivers to the
+    GUI thread via queued connections — the window never needs to pump
+    processEvents. Confirmation prompts go the other way: the worker emits
+    ``needs_confirm`` with a fresh :class:`_ConfirmSink` and blocks on its
+    semaphore until the GUI slot resolves it.
+    """
+
+    progress = QtCore.pyqtSignal(str, int, int)
+    finished = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+    # kind ("update"/"removal"), FileChange, _ConfirmSink
+    needs_confirm = QtCore.pyqtSignal(str, object, object)
+
+    def __init__(
+        self,
+        engine: SyncEngine,
+        modpack: ModpackInfo,
+        plan: SyncPlan,
+        snapshot_payload: dict,
+        create_backups: bool,
+        existing_sources: Optional[set],
+        existing_targets: Optional[set],
+        accepted_updates: Optional[set] = None,
+        accepted_removals: Optional[set] = None,
+    ) -> None:
+        super().__init__()
+        self._engine = engine
+        self._modpack = modpack
+        self._plan = plan
+        self._snapshot_payload = snapshot_payload
+        self._create_backups = create_backups
+        self._existing_sources = existing_sources
+        self._existing_targets = existing_targets
+        self._accepted_updates = accepted_updates
+        self._accepted_removals = accepted_removals
+        self._last_pct = -1
+        self._last_emit = 0.0
+
+    def _confirmer(self, kind: str, accepted: Optional[set]) -> ConfirmationCallback:
+        # Decisions collected up front become plain set lookups; without
+        # them each prompt round-trips to the GUI thread.
+        if accepted is not None:
+            return lambda change: change.relative_path.as_posix() in accepted
+        return lambda change: self._ask(kind, change)
+
+    def run(self) -> None:
+        try:
+            self._engine.execute_plan(
+                modpack=self._modpack,
+                plan=self._plan,
+                snapshot_payload=self._snapshot_payload,
+                create_backups=self._create_backups,
+                confirm_update=self._confirmer("update", self._accepted_updates),
+                confirm_removal=self._confirmer("removal", self._accepted_removals),
+                progress_callback=self._on_progress,
+                existing_sources=self._existing_sources,
+                existing_targets=self._existing_targets,
+            )
+        except Exception as exc:
+            self.failed.emit(str(exc))
+        else:
+            self.finished.emit()
+
+    def _on_progress(self, message: str, current: int, total: int) -> None:
+        """Forward engine progress, dropping sub-percent repeats.
+
+        Emitting every per-file callback floods the queued-connection event
+        queue faster than the GUI drains it; ticks go out only on a percent
+        change, after ~33 ms of silence, or at completion.
+        """
+        pct = current * 100 // max(total, 1)
+        now = time.monotonic()
+        if pct == self._last_pct and current < total and now - self._last_emit < 0.033:
+            return
+        self._last_pct = pct
+        self._last_emit = now
+        self.progress.emit(message, current, total)
+
+    def _ask(self, kind: str, change: FileChange) -> bool:
+        """Request a confirmation from the GUI thread and wait for it."""
+        sink = _ConfirmSink()
+        self.needs_confirm.emit(kind, change, sink)
+        sink.semaphore.acquire()
+        return sink.allowed
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """Primary application window."""
 
+    # Shared across windows; QStyle.standardIcon is surprisingly costly.
+    _window_icon: Optional[QtGui.QIcon] = None
+
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Minecraft Modpack Sync")
         self.resize(1400, 850)
-        
+
         # Set application icon (using default system icon if no custom one)
-        self.setWindowIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon))
+        if MainWindow._window_icon is None:
+            MainWindow._window_icon = self.style().standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon
+            )
+        self.setWindowIcon(MainWindow._window_icon)
 
         self.config_manager = ConfigManager()
         self.engine = SyncEngine(config_manager=self.config_manager, log_callback=self.append_log)
+        self._home_str = str(Path.home())
 
         self.modpacks: list[ModpackInfo] = []
         self.selected_modpack: Optional[ModpackInfo] = None
         self.current_plan: Optional[SyncPlan] = None
         self.current_snapshot_payload: Optional[dict] = None
+        self.current_existing_sources: Optional[set] = None
+        self.current_existing_targets: Optional[set] = None
+        self._plan_worker: Optional[_PlanWorker] = None
+        self._refresh_worker: Optional[_RefreshWorker] = None
+        self._sync_worker: Optional[SyncWorker] = None
+        self._sync_thread: Optional[QtCore.QThread] = None
+        # Set when the user ticks "don't ask again" in the confirmation
+        # dialog; later syncs this session then accept every change.
+        self._session_confirm_all = False
+
+        # Worker progress lands here and a ~30 Hz timer applies the latest
+        # value, so repaints are bounded by wall time, not file count.
+        self._pending_progress: Optional[tuple[str, int, int]] = None
+        self._last_progress_pct = -1
+        self._last_progress_msg: Optional[str] = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
+        # One QCursor for every busy section instead of a fresh object per
+        # setOverrideCursor call. Built here because QCursor needs a live
+        # QGuiApplication.
+        self._wait_cursor = QtGui.QCursor(QtCore.Qt.CursorShape.WaitCursor)
+        # Maps path text as shown in the line edits to its resolved Path, so
+        # repeated saves of unchanged input skip expanduser/resolve syscalls.
+        self._resolved_paths: dict[str, Path] = {}
+        # Browse dialogs reopen at the last-picked directory per field
+        # instead of re-deriving $HOME on every click.
+        self._last_browse_dir: dict[str, str] = {}
+
+        # Log lines are buffered and flushed on a timer so bursty engine
+        # callbacks cost one text insertion per tick instead of one
+        # layout/repaint per line.
+        self._log_buffer: deque[str] = deque()
+        # Single-shot and armed by append_log: the timer only ever fires
+        # when lines are waiting, so an idle window takes no wakeups.
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
 
         self._setup_ui()
         self._apply_modern_styling()
         self._load_initial_state()
 
     def _apply_modern_styling(self) -> None:
-        """Apply modern stylesheet to the application."""
-        self.setStyleSheet(get_modern_stylesheet())
+        """Apply modern stylesheet to the application.
+
+        Styling the QApplication (rather than each window) means child
+        dialogs inherit it without their own parse, and the unchanged-check
+        avoids Qt re-polishing the whole widget tree on repeat calls.
+        """
+        app = QtWidgets.QApplication.instance()
+        target = app if app is not None else self
+        if target.styleSheet() != _MODERN_STYLESHEET:
+            target.setStyleSheet(_MODERN_STYLESHEET)
 
     # ------------------------------------------------------------------ UI SETUP
+    def _std_icon(self, pixmap: QtWidgets.QStyle.StandardPixmap) -> QtGui.QIcon:
+        """Return a themed standard icon for buttons.
+
+        Buttons use real icons plus plain text instead of emoji prefixes,
+        which avoids falling back to the system emoji font (a glyph-cache
+        miss on first paint) and repeated glyph lookups on repaint.
+        """
+        return self.style().standardIcon(pixmap)
+
     def _setup_ui(self) -> None:
         central_widget = QtWidgets.QWidget(self)
         self.setCentralWidget(central_widget)
@@ -344,12 +831,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Header with title
         header_layout = QtWidgets.QHBoxLayout()
         title_label = QtWidgets.QLabel("🎮 Minecraft Modpack Sync")
-        title_label.setStyleSheet(f"""
-            font-size: 24px;
-            font-weight: bold;
-            color: {COLORS['primary']};
-            padding: 10px;
-        """)
+        title_label.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         main_layout.addLayout(header_layout)
@@ -363,34 +845,28 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # CurseForge Instances path
         instances_label = QtWidgets.QLabel("CurseForge Instances:")
-        instances_label.setStyleSheet(f"font-weight: 600; color: {COLORS['text_primary']};")
+        instances_label.setStyleSheet(_LABEL_BOLD_QSS)
         self.instances_path_edit = QtWidgets.QLineEdit(paths_group)
         self.instances_path_edit.setPlaceholderText("Select your CurseForge instances directory...")
-        self.instances_browse_btn = QtWidgets.QPushButton("📂 Browse", paths_group)
+        self.instances_browse_btn = QtWidgets.QPushButton("Browse", paths_group)
+        self.instances_browse_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_DirOpenIcon))
         self.instances_browse_btn.setMaximumWidth(120)
         self.instances_browse_btn.clicked.connect(self._browse_instances_path)
 
         # Custom Launcher Game path
         game_label = QtWidgets.QLabel("Custom Launcher Game:")
-        game_label.setStyleSheet(f"font-weight: 600; color: {COLORS['text_primary']};")
+        game_label.setStyleSheet(_LABEL_BOLD_QSS)
         self.game_path_edit = QtWidgets.QLineEdit(paths_group)
         self.game_path_edit.setPlaceholderText("Select your game directory...")
-        self.game_browse_btn = QtWidgets.QPushButton("📂 Browse", paths_group)
+        self.game_browse_btn = QtWidgets.QPushButton("Browse", paths_group)
+        self.game_browse_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_DirOpenIcon))
         self.game_browse_btn.setMaximumWidth(120)
         self.game_browse_btn.clicked.connect(self._browse_game_path)
 
-        self.save_paths_btn = QtWidgets.QPushButton("💾 Save Paths", paths_group)
+        self.save_paths_btn = QtWidgets.QPushButton("Save Paths", paths_group)
+        self.save_paths_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_DialogSaveButton))
         self.save_paths_btn.setMaximumWidth(140)
-        self.save_paths_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['success']};
-                color: #0D1B0E;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #57A75F;
-            }}
-        """)
+        self.save_paths_btn.setStyleSheet(_SAVE_BTN_QSS)
         self.save_paths_btn.clicked.connect(self._save_paths)
 
         paths_layout.addWidget(instances_label, 0, 0)
@@ -420,25 +896,21 @@ class MainWindow(QtWidgets.QMainWindow):
         modpack_layout.setContentsMargins(12, 16, 12, 12)
         modpack_layout.setSpacing(10)
 
-        self.refresh_modpacks_btn = QtWidgets.QPushButton("🔄 Refresh Modpacks", modpack_group)
+        self.refresh_modpacks_btn = QtWidgets.QPushButton("Refresh Modpacks", modpack_group)
+        self.refresh_modpacks_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_BrowserReload))
         self.refresh_modpacks_btn.setObjectName("refreshButton")
         self.refresh_modpacks_btn.clicked.connect(self._refresh_modpacks)
         modpack_layout.addWidget(self.refresh_modpacks_btn)
 
         self.modpack_list = QtWidgets.QListWidget(modpack_group)
-        self.modpack_list.currentRowChanged.connect(self._on_modpack_selected)
+        # All rows are one-line entries; let Qt skip per-row size hints.
+        self.modpack_list.setUniformItemSizes(True)
+        self.modpack_list.currentItemChanged.connect(self._on_modpack_selected)
         modpack_layout.addWidget(self.modpack_list, stretch=1)
 
         self.modpack_details_label = QtWidgets.QLabel("", modpack_group)
         self.modpack_details_label.setWordWrap(True)
-        self.modpack_details_label.setStyleSheet(f"""
-            background-color: {COLORS['surface']};
-            border: 1px solid {COLORS['border']};
-            border-radius: 6px;
-            padding: 10px;
-            font-size: 11px;
-            color: {COLORS['text_secondary']};
-        """)
+        self.modpack_details_label.setStyleSheet(_DETAILS_QSS)
         self.modpack_details_label.setMinimumHeight(60)
         modpack_layout.addWidget(self.modpack_details_label)
 
@@ -456,40 +928,46 @@ class MainWindow(QtWidgets.QMainWindow):
         preview_layout.setContentsMargins(12, 16, 12, 12)
         preview_layout.setSpacing(10)
 
-        self.preview_tree = QtWidgets.QTreeWidget(preview_group)
-        self.preview_tree.setColumnCount(4)
-        self.preview_tree.setHeaderLabels(["Action", "Relative Path", "Size", "Details"])
+        self.preview_tree = QtWidgets.QTreeView(preview_group)
+        self.preview_model = SyncPlanModel(self.preview_tree)
+        self.preview_tree.setModel(self.preview_model)
+        self.preview_tree.setRootIsDecorated(False)
         self.preview_tree.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.preview_tree.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.preview_tree.setAlternatingRowColors(True)
-        self.preview_tree.itemSelectionChanged.connect(self._on_preview_selection_changed)
-        
+        self.preview_tree.setUniformRowHeights(True)
+        self.preview_tree.selectionModel().selectionChanged.connect(self._on_preview_selection_changed)
+
         # Set column widths
         self.preview_tree.setColumnWidth(0, 100)
         self.preview_tree.setColumnWidth(1, 300)
         self.preview_tree.setColumnWidth(2, 100)
-        
+
         preview_layout.addWidget(self.preview_tree)
 
         buttons_layout = QtWidgets.QHBoxLayout()
         buttons_layout.setSpacing(10)
         
-        self.preview_btn = QtWidgets.QPushButton("🔍 Preview Changes", preview_group)
+        self.preview_btn = QtWidgets.QPushButton("Preview Changes", preview_group)
+        self.preview_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_FileDialogContentsView))
         self.preview_btn.clicked.connect(self._preview_selected_modpack)
         self.preview_btn.setMinimumHeight(35)
 
-        self.sync_btn = QtWidgets.QPushButton("✨ Sync Now", preview_group)
+        self.sync_btn = QtWidgets.QPushButton("Sync Now", preview_group)
+        self.sync_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_DialogApplyButton))
         self.sync_btn.setObjectName("syncButton")
         self.sync_btn.clicked.connect(self._sync_selected_modpack)
         self.sync_btn.setEnabled(False)
         self.sync_btn.setMinimumHeight(35)
 
-        self.exclude_btn = QtWidgets.QPushButton("🚫 Exclude Selected", preview_group)
+        self.exclude_btn = QtWidgets.QPushButton("Exclude Selected", preview_group)
+        self.exclude_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_DialogCancelButton))
         self.exclude_btn.setObjectName("excludeButton")
         self.exclude_btn.clicked.connect(self._exclude_selected)
         self.exclude_btn.setEnabled(False)
 
         self.backup_checkbox = QtWidgets.QCheckBox("💾 Create backup before syncing", preview_group)
-        self.backup_checkbox.setStyleSheet("font-weight: 500;")
+        self.backup_checkbox.setStyleSheet(_CHECKBOX_QSS)
 
         buttons_layout.addWidget(self.preview_btn)
         buttons_layout.addWidget(self.sync_btn)
@@ -508,10 +986,14 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.log_output = QtWidgets.QPlainTextEdit(log_group)
         self.log_output.setReadOnly(True)
+        # Evict old lines past 5k blocks so a long session's log cannot grow
+        # the QTextDocument without bound.
+        self.log_output.setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_output)
         
         # Clear log button
-        clear_log_btn = QtWidgets.QPushButton("🗑️ Clear Log", log_group)
+        clear_log_btn = QtWidgets.QPushButton("Clear Log", log_group)
+        clear_log_btn.setIcon(self._std_icon(QtWidgets.QStyle.StandardPixmap.SP_TrashIcon))
         clear_log_btn.setMaximumWidth(120)
         clear_log_btn.clicked.connect(lambda: self.log_output.clear())
         log_layout.addWidget(clear_log_btn)
@@ -539,7 +1021,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.progress_bar.setMinimumHeight(20)
         
         self.status_message = QtWidgets.QLabel("✅ Ready", self.status_widget)
-        self.status_message.setStyleSheet(f"font-weight: 500; color: {COLORS['success']};")
+        self.status_message.setStyleSheet(_STATUS_SUCCESS_QSS)
         
         status_layout.addWidget(self.progress_bar)
         status_layout.addWidget(self.status_message)
@@ -550,46 +1032,88 @@ class MainWindow(QtWidgets.QMainWindow):
     # ----------------------------------------------------------------- INIT LOAD
     def _load_initial_state(self) -> None:
         config = self.engine.config
-        self.instances_path_edit.setText(str(config.instances_path))
-        self.game_path_edit.setText(str(config.game_path))
+        instances_text = str(config.instances_path)
+        game_text = str(config.game_path)
+        self._resolved_paths[instances_text] = config.instances_path
+        self._resolved_paths[game_text] = config.game_path
+        self.instances_path_edit.setText(instances_text)
+        self.game_path_edit.setText(game_text)
         self.backup_checkbox.setChecked(bool(config.backup_dir))
         self.append_log("🚀 Application started successfully")
         self._refresh_modpacks()
 
     # ----------------------------------------------------------------- UTILITIES
     def append_log(self, message: str) -> None:
-        """Append a message to the log with timestamp."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_output.appendPlainText(formatted_message)
-        self.log_output.ensureCursorVisible()
+        """Queue a timestamped message for the next log flush."""
+        # time.strftime formats directly from the C localtime, skipping the
+        # datetime object a datetime.now().strftime() round-trip would build.
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        # Engine callbacks land here from worker threads, and timers may
+        # only be started from their own thread — queue the start instead.
+        # The isActive guard keeps log spam from endlessly rearming it.
+        if not self._log_timer.isActive():
+            QtCore.QMetaObject.invokeMethod(
+                self._log_timer, "start", QtCore.Qt.ConnectionType.QueuedConnection
+            )
+
+    def _flush_log(self) -> None:
+        """Insert all buffered log lines in a single text operation."""
+        if not self._log_buffer:
+            return
+        lines = tuple(self._log_buffer)
+        self._log_buffer.clear()
+        # Only follow the tail if the user was already there; appending must
+        # not yank the viewport away from history they scrolled up to read.
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.insertText("\n".join(lines) + "\n")
+        if at_bottom:
+            self.log_output.ensureCursorVisible()
 
     def _set_status(self, message: str, is_error: bool = False) -> None:
         """Update the status bar message with appropriate styling."""
         icon = "❌" if is_error else "ℹ️"
-        color = COLORS['danger'] if is_error else COLORS['primary']
-        self.status_message.setText(f"{icon} {message}")
-        self.status_message.setStyleSheet(f"font-weight: 500; color: {color};")
+        self.status_message.setText(_STATUS_TMPL.format(icon=icon, msg=message))
+        self.status_message.setStyleSheet(_STATUS_ERROR_QSS if is_error else _STATUS_INFO_QSS)
 
     def _browse_instances_path(self) -> None:
         directory = QtWidgets.QFileDialog.getExistingDirectory(
-            self, 
+            self,
             "Select CurseForge Instances Directory",
-            str(Path.home())
+            self._last_browse_dir.get("instances", self._home_str)
         )
         if directory:
+            self._last_browse_dir["instances"] = directory
             self.instances_path_edit.setText(directory)
 
     def _browse_game_path(self) -> None:
         directory = QtWidgets.QFileDialog.getExistingDirectory(
-            self, 
+            self,
             "Select Custom Launcher Game Directory",
-            str(Path.home())
+            self._last_browse_dir.get("game", self._home_str)
         )
         if directory:
+            self._last_browse_dir["game"] = directory
             self.game_path_edit.setText(directory)
 
+    def _resolve_path_text(self, text: str) -> Path:
+        """Turn line-edit text into a Path, reusing prior resolutions.
+
+        resolve() hits the filesystem, so it is skipped for already-absolute
+        input and cached per text so re-saving unchanged paths is free.
+        """
+        cached = self._resolved_paths.get(text)
+        if cached is not None:
+            return cached
+        path = Path(text).expanduser()
+        if not path.is_absolute():
+            path = path.resolve()
+        self._resolved_paths[text] = path
+        return path
+
     def _save_paths(self) -> None:
         # Get and validate input
         instances_text = self.instances_path_edit.text().strip()
@@ -604,8 +1128,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         
         try:
-            instances_path = Path(instances_text).expanduser().resolve()
-            game_path = Path(game_text).expanduser().resolve()
+            instances_path = self._resolve_path_text(instances_text)
+            game_path = self._resolve_path_text(game_text)
         except Exception as e:
             QtWidgets.QMessageBox.warning(
                 self,
@@ -628,9 +1152,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 self,
                 "Create Directory",
                 f"Game path does not exist. Create it?\n{game_path}",
-                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+                _MB_YES | _MB_NO
             )
-            if response == QtWidgets.QMessageBox.StandardButton.Yes:
+            if response == _MB_YES:
                 game_path.mkdir(parents=True, exist_ok=True)
             else:
                 return
@@ -642,33 +1166,76 @@ class MainWindow(QtWidgets.QMainWindow):
         self._refresh_modpacks()
 
     def _refresh_modpacks(self) -> None:
-        self.modpack_list.clear()
+        if self._refresh_worker is not None:
+            return
         self.append_log("🔄 Refreshing modpack list...")
-        self.modpacks = self.engine.list_modpacks()
-        
-        for modpack in self.modpacks:
-            item = QtWidgets.QListWidgetItem(f"📦 {modpack.name}")
-            self.modpack_list.addItem(item)
+        # Discovery stats every instance directory; run it on the shared
+        # pool (reused threads, no per-click QThread teardown) and populate
+        # the list when results arrive.
+        self.modpack_list.setCursor(self._wait_cursor)
+        worker = _RefreshWorker(self.engine)
+        worker.signals.finished.connect(self._on_modpacks_ready)
+        worker.signals.error.connect(self._on_refresh_error)
+        self._refresh_worker = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_refresh_error(self, message: str) -> None:
+        self._refresh_worker = None
+        self.modpack_list.unsetCursor()
+        self._set_status("Error refreshing modpacks", is_error=True)
+        self.append_log(f"❌ Error: {message}")
+
+    def _on_modpacks_ready(self, modpacks: object) -> None:
+        self._refresh_worker = None
+        self.modpack_list.unsetCursor()
+        self.modpacks = modpacks
+
+        # Block signals for the rebuild: clear() would otherwise emit
+        # currentItemChanged(None) and run the selection handler against a
+        # half-built list. Selection is re-established (and its signal
+        # emitted) once the list is final.
+        self.modpack_list.setUpdatesEnabled(False)
+        blocker = QtCore.QSignalBlocker(self.modpack_list)
+        try:
+            self.modpack_list.clear()
+            # addItems inserts the whole batch with one model notification;
+            # the UserRole payload is attached in a post-pass.
+            self.modpack_list.addItems(
+                [_MODPACK_ITEM_TMPL.format(name=modpack.name) for modpack in self.modpacks]
+            )
+            for row, modpack in enumerate(self.modpacks):
+                self.modpack_list.item(row).setData(_USER_ROLE, modpack)
+        finally:
+            blocker.unblock()
+            self.modpack_list.setUpdatesEnabled(True)
 
         if self.modpacks:
             self.modpack_list.setCurrentRow(0)
             self.append_log(f"✅ Found {len(self.modpacks)} modpack(s)")
         else:
+            self.selected_modpack = None
             self.modpack_details_label.setText("ℹ️ No modpacks detected. Check your CurseForge instances path.")
-            self.preview_tree.clear()
+            self.preview_model.set_plan(None)
             self.sync_btn.setEnabled(False)
             self.exclude_btn.setEnabled(False)
             self.append_log("⚠️ No modpacks found in the specified directory")
 
-    def _on_modpack_selected(self, index: int) -> None:
-        if index < 0 or index >= len(self.modpacks):
+    def _on_modpack_selected(
+        self,
+        current: Optional[QtWidgets.QListWidgetItem],
+        previous: Optional[QtWidgets.QListWidgetItem] = None,
+    ) -> None:
+        # The ModpackInfo rides along in the item itself, so selection no
+        # longer depends on row order matching self.modpacks.
+        modpack = current.data(_USER_ROLE) if current else None
+        if modpack is None:
             self.selected_modpack = None
             self.modpack_details_label.clear()
             self.sync_btn.setEnabled(False)
             self.exclude_btn.setEnabled(False)
             return
 
-        self.selected_modpack = self.modpacks[index]
+        self.selected_modpack = modpack
         info_lines = [
             f"<b>Modpack:</b> {self.selected_modpack.name}",
             f"<b>Path:</b> {self.selected_modpack.path}"
@@ -677,7 +1244,7 @@ class MainWindow(QtWidgets.QMainWindow):
             info_lines.append(f"<b>Manifest:</b> {self.selected_modpack.manifest_path.name}")
         
         self.modpack_details_label.setText("<br>".join(info_lines))
-        self.preview_tree.clear()
+        self.preview_model.set_plan(None)
         self.current_plan = None
         self.current_snapshot_payload = None
         self.sync_btn.setEnabled(False)
@@ -692,97 +1259,106 @@ class MainWindow(QtWidgets.QMainWindow):
                 "Please select a modpack first."
             )
             return
+        if self._plan_worker is not None:
+            # A plan is already building (this is reachable programmatically,
+            # e.g. via _exclude_selected, while the button is disabled);
+            # starting a second worker would race it for the result slots.
+            return
 
         self._set_status("🔍 Building sync plan...")
         self.append_log(f"🔍 Analyzing changes for {self.selected_modpack.name}...")
-        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
-        
-        try:
-            plan, snapshot_payload, *_ = self.engine.create_sync_plan(self.selected_modpack)
-            self.current_plan = plan
-            self.current_snapshot_payload = snapshot_payload
-            self._populate_preview(plan)
-            self.sync_btn.setEnabled(True and not plan.is_empty())
-            self.exclude_btn.setEnabled(False)
-            
-            if plan.is_empty():
-                self._set_status("✅ Everything is already in sync")
-                self.append_log("✅ No changes needed - everything is up to date")
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Sync Status",
-                    "Everything is already in sync! No changes needed."
-                )
-            else:
-                total_changes = len(plan.adds) + len(plan.updates) + len(plan.removals)
-                self._set_status(f"✅ Preview ready - {total_changes} change(s) detected")
-                self.append_log(f"📊 Found {len(plan.adds)} additions, {len(plan.updates)} updates, {len(plan.removals)} removals")
-        except Exception as e:
-            self._set_status(f"Error building sync plan", is_error=True)
-            self.append_log(f"❌ Error: {str(e)}")
-            QtWidgets.QMessageBox.critical(
+        # Busy cursor on the preview only — a global override forces every
+        # widget to re-resolve its cursor on repaint.
+        self.preview_tree.setCursor(self._wait_cursor)
+        self.preview_btn.setEnabled(False)
+        self.sync_btn.setEnabled(False)
+
+        # Planning is filesystem-bound; run it on the pool so the event loop
+        # keeps painting. Results arrive back via queued signals.
+        worker = _PlanWorker(self.engine, self.selected_modpack)
+        worker.signals.finished.connect(
+            lambda result, worker=worker: self._on_plan_ready(worker, result)
+        )
+        worker.signals.error.connect(
+            lambda message, worker=worker: self._on_plan_error(worker, message)
+        )
+        self._plan_worker = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_plan_ready(self, worker: _PlanWorker, result: object) -> None:
+        if worker is not self._plan_worker:
+            # A superseded worker; the active one owns the UI state.
+            return
+        self.preview_tree.unsetCursor()
+        self.preview_btn.setEnabled(True)
+        self._plan_worker = None
+        if worker.modpack is not self.selected_modpack:
+            # The selection moved on while the plan built. Adopting the
+            # result would let a sync execute one pack's plan and record
+            # its snapshot under another pack's name.
+            return
+
+        plan, snapshot_payload, _, _, existing_sources, existing_targets = result
+        self.current_plan = plan
+        self.current_snapshot_payload = snapshot_payload
+        self.current_existing_sources = existing_sources
+        self.current_existing_targets = existing_targets
+        self._populate_preview(plan)
+        self.sync_btn.setEnabled(not plan.is_empty())
+        self.exclude_btn.setEnabled(False)
+
+        if plan.is_empty():
+            self._set_status("✅ Everything is already in sync")
+            self.append_log("✅ No changes needed - everything is up to date")
+            QtWidgets.QMessageBox.information(
                 self,
-                "Error",
-                f"Failed to build sync plan:\n{str(e)}"
+                "Sync Status",
+                "Everything is already in sync! No changes needed."
             )
-        finally:
-            QtWidgets.QApplication.restoreOverrideCursor()
+        else:
+            total_changes = len(plan.adds) + len(plan.updates) + len(plan.removals)
+            self._set_status(f"✅ Preview ready - {total_changes} change(s) detected")
+            self.append_log(f"📊 Found {len(plan.adds)} additions, {len(plan.updates)} updates, {len(plan.removals)} removals")
+
+    def _on_plan_error(self, worker: _PlanWorker, message: str) -> None:
+        if worker is not self._plan_worker:
+            return
+        self.preview_tree.unsetCursor()
+        self.preview_btn.setEnabled(True)
+        self._plan_worker = None
+        if worker.modpack is not self.selected_modpack:
+            # Stale failure for a pack no longer selected; nothing to report.
+            return
+
+        self._set_status("Error building sync plan", is_error=True)
+        self.append_log(f"❌ Error: {message}")
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to build sync plan:\n{message}"
+        )
 
     def _populate_preview(self, plan: SyncPlan) -> None:
-        self.preview_tree.clear()
-
-        def add_items(category: str, changes: list[FileChange], color: QtGui.QColor, icon: str) -> None:
-            for change in changes:
-                item = QtWidgets.QTreeWidgetItem(self.preview_tree)
-                item.setText(0, f"{icon} {category}")
-                item.setText(1, change.relative_path.as_posix())
-                if change.size_bytes is not None:
-                    item.setText(2, self._format_size(change.size_bytes))
-                item.setText(3, change.reason or "")
-                item.setData(0, QtCore.Qt.ItemDataRole.UserRole, change)
-                
-                # Apply color to all columns
-                for column in range(4):
-                    item.setForeground(column, QtGui.QBrush(color))
-                    # Make action column bold
-                    if column == 0:
-                        font = item.font(column)
-                        font.setBold(True)
-                        item.setFont(column, font)
-
-        # Add items with appropriate colors and icons
-        add_items("Add", plan.adds, QtGui.QColor(COLORS['success']), "➕")
-        add_items("Update", plan.updates, QtGui.QColor(COLORS['warning']), "🔄")
-        add_items("Remove", plan.removals, QtGui.QColor(COLORS['danger']), "🗑️")
-        add_items("Skip", plan.skipped, QtGui.QColor(COLORS['text_secondary']), "⏭️")
-
-        self.preview_tree.sortItems(0, QtCore.Qt.SortOrder.AscendingOrder)
-        
-        # Expand all items for better visibility
-        self.preview_tree.expandAll()
+        # One model reset; the view renders rows lazily from the plan lists,
+        # already grouped Add/Update/Remove/Skip. The tree is flat, so no
+        # sort or expand pass is needed.
+        self.preview_model.set_plan(plan)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Make sure any debounced history writes hit disk before exit.
+        self.engine.history_store.flush()
+        super().closeEvent(event)
 
     def _on_preview_selection_changed(self) -> None:
-        has_selection = bool(self.preview_tree.selectedItems())
+        has_selection = self.preview_tree.selectionModel().hasSelection()
         self.exclude_btn.setEnabled(has_selection and self.current_plan is not None)
 
-    @staticmethod
-    def _format_size(size: int) -> str:
-        """Format file size in a human-readable format."""
-        if size < 1024:
-            return f"{size} B"
-        for unit in ["KB", "MB", "GB"]:
-            size /= 1024
-            if size < 1024:
-                return f"{size:.2f} {unit}"
-        return f"{size:.2f} TB"
-
     def _exclude_selected(self) -> None:
-        selected_items = self.preview_tree.selectedItems()
-        if not selected_items or not self.selected_modpack:
+        selected_rows = self.preview_tree.selectionModel().selectedRows()
+        if not selected_rows or not self.selected_modpack:
             return
 
-        item = selected_items[0]
-        change: FileChange = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        change = self.preview_model.change_at(selected_rows[0].row())
         if not change:
             return
 
@@ -791,10 +1367,10 @@ class MainWindow(QtWidgets.QMainWindow):
             "Exclude File",
             f"Exclude this file from future syncs?\n\n{change.relative_path}\n\n"
             "This file will be ignored in all future sync operations.",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+            _MB_YES | _MB_NO,
         )
         
-        if response == QtWidgets.QMessageBox.StandardButton.Yes:
+        if response == _MB_YES:
             self.engine.add_exclusion(self.selected_modpack.name, change.relative_path.as_posix())
             self.append_log(f"🚫 Excluded: {change.relative_path}")
             self._preview_selected_modpack()
@@ -822,75 +1398,158 @@ class MainWindow(QtWidgets.QMainWindow):
             self,
             "Confirm Sync",
             f"<b>Proceed with syncing {self.selected_modpack.name}?</b><br><br>{summary}",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+            _MB_YES | _MB_NO,
         )
         
-        if confirm != QtWidgets.QMessageBox.StandardButton.Yes:
+        if confirm != _MB_YES:
             self.append_log("⏸️ Sync cancelled by user")
             return
 
+        # Gather every per-file decision now, in one dialog, so the worker
+        # never has to stop and wait for an answer mid-sync.
+        pending_updates = (
+            [] if self.engine.config.auto_confirm_updates else self.current_plan.updates
+        )
+        pending_removals = (
+            [] if self.engine.config.auto_confirm_removals else self.current_plan.removals
+        )
+        accepted_updates: Optional[set] = None
+        accepted_removals: Optional[set] = None
+        if self._session_confirm_all:
+            accepted_updates = {c.relative_path.as_posix() for c in pending_updates}
+            accepted_removals = {c.relative_path.as_posix() for c in pending_removals}
+        elif pending_updates or pending_removals:
+            dialog = ConfirmChangesDialog(pending_updates, pending_removals, self)
+            if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+                self.append_log("⏸️ Sync cancelled by user")
+                return
+            accepted_updates = dialog.accepted_updates()
+            accepted_removals = dialog.accepted_removals()
+            if dialog.dont_ask_again():
+                self._session_confirm_all = True
+
         self.append_log(f"▶️ Starting sync for {self.selected_modpack.name}...")
-        self.progress_bar.setMaximum(max(total_changes, 1))
+        self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
+        self._last_progress_pct = -1
+        self._last_progress_msg = None
         self._set_status("🔄 Sync in progress...")
-        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.CursorShape.WaitCursor)
-
-        def progress_handler(message: str, current: int, total: int) -> None:
-            self.progress_bar.setMaximum(max(total, 1))
-            self.progress_bar.setValue(current)
+        self.preview_tree.setCursor(self._wait_cursor)
+        self.sync_btn.setEnabled(False)
+        self.preview_btn.setEnabled(False)
+
+        # Execution runs on its own thread so the event loop keeps painting;
+        # progress and confirmations are marshalled through queued signals
+        # instead of a processEvents pump.
+        worker = SyncWorker(
+            engine=self.engine,
+            modpack=self.selected_modpack,
+            plan=self.current_plan,
+            snapshot_payload=self.current_snapshot_payload,
+            create_backups=self.backup_checkbox.isChecked(),
+            existing_sources=self.current_existing_sources,
+            existing_targets=self.current_existing_targets,
+            accepted_updates=accepted_updates,
+            accepted_removals=accepted_removals,
+        )
+        thread = QtCore.QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        # Explicitly queued: the worker's emits must return immediately
+        # rather than ever executing GUI slots on its own thread.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        worker.progress.connect(self._on_sync_progress, queued)
+        worker.needs_confirm.connect(self._on_sync_confirm, queued)
+        worker.finished.connect(self._on_sync_finished, queued)
+        worker.failed.connect(self._on_sync_failed, queued)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._sync_worker = worker
+        self._sync_thread = thread
+        self._progress_timer.start()
+        thread.start()
+
+    def _on_sync_progress(self, message: str, current: int, total: int) -> None:
+        # Only record the latest update; _apply_pending_progress paints it.
+        self._pending_progress = (message, current, total)
+
+    def _apply_pending_progress(self) -> None:
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+        message, current, total = pending
+        # The bar runs 0-100: byte-weighted totals can exceed QProgressBar's
+        # 32-bit range, and whole percents bound repaints at 100 per sync.
+        pct = min(current * 100 // max(total, 1), 100)
+        if pct != self._last_progress_pct:
+            self._last_progress_pct = pct
+            self.progress_bar.setValue(pct)
+        if message != self._last_progress_msg:
+            self._last_progress_msg = message
             self._set_status(f"🔄 {message}")
-            QtWidgets.QApplication.processEvents()
-
-        def confirm_update(change: FileChange) -> bool:
-            result = QtWidgets.QMessageBox.question(
-                self,
-                "Confirm Update",
-                f"Replace existing file?\n\n<b>{change.relative_path}</b>",
-                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-            )
-            return result == QtWidgets.QMessageBox.StandardButton.Yes
-
-        def confirm_removal(change: FileChange) -> bool:
-            result = QtWidgets.QMessageBox.question(
-                self,
-                "Confirm Removal",
-                f"Delete file removed from modpack?\n\n<b>{change.relative_path}</b>",
-                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-            )
-            return result == QtWidgets.QMessageBox.StandardButton.Yes
 
-        try:
-            self.engine.execute_plan(
-                modpack=self.selected_modpack,
-                plan=self.current_plan,
-                snapshot_payload=self.current_snapshot_payload,
-                create_backups=self.backup_checkbox.isChecked(),
-                confirm_update=confirm_update,
-                confirm_removal=confirm_removal,
-                progress_callback=progress_handler,
-            )
-            self._set_status("✅ Sync completed successfully")
-            self.append_log(f"✅ Sync completed for {self.selected_modpack.name}")
-            self.progress_bar.setValue(self.progress_bar.maximum())
-            
-            QtWidgets.QMessageBox.information(
-                self, 
-                "Sync Complete", 
-                f"<b>Synchronization complete!</b><br><br>"
-                f"Your modpack has been successfully synced."
-            )
-        except Exception as exc:
-            self._set_status("Sync failed", is_error=True)
-            self.append_log(f"❌ Sync failed: {str(exc)}")
-            QtWidgets.QMessageBox.critical(
-                self, 
-                "Sync Failed", 
-                f"<b>Synchronization failed:</b><br><br>{str(exc)}"
-            )
-        finally:
-            QtWidgets.QApplication.restoreOverrideCursor()
+    def _on_sync_confirm(self, kind: str, change: FileChange, sink: _ConfirmSink) -> None:
+        if kind == "update":
+            title = "Confirm Update"
+            question = f"Replace existing file?\n\n<b>{change.relative_path}</b>"
+        else:
+            title = "Confirm Removal"
+            question = f"Delete file removed from modpack?\n\n<b>{change.relative_path}</b>"
+        result = QtWidgets.QMessageBox.question(self, title, question, _MB_YES | _MB_NO)
+        sink.resolve(result == _MB_YES)
+
+    def _sync_cleanup(self) -> None:
+        self._progress_timer.stop()
+        self._apply_pending_progress()
+        self.preview_tree.unsetCursor()
+        self.sync_btn.setEnabled(True)
+        self.preview_btn.setEnabled(True)
+        self._sync_worker = None
+        self._sync_thread = None
+
+    def _on_sync_finished(self) -> None:
+        self._sync_cleanup()
+        self._set_status("✅ Sync completed successfully")
+        self.append_log(f"✅ Sync completed for {self.selected_modpack.name}")
+        self.progress_bar.setValue(self.progress_bar.maximum())
+
+        QtWidgets.QMessageBox.information(
+            self,
+            "Sync Complete",
+            f"<b>Synchronization complete!</b><br><br>"
+            f"Your modpack has been successfully synced."
+        )
+        # plan.skipped starts out holding every already-in-sync file; only
+        # entries whose action is not SKIP were declined during execution.
+        declined_any = self.current_plan is not None and any(
+            change.action is not FileAction.SKIP for change in self.current_plan.skipped
+        )
+        if self.current_plan is not None and not declined_any:
+            # Every planned change was applied, so the outcome is known
+            # without re-scanning both trees: nothing is pending.
+            self.current_plan = SyncPlan()
+            self.preview_model.set_plan(None)
+            self.sync_btn.setEnabled(False)
+            self.exclude_btn.setEnabled(False)
+        else:
+            # Files the user declined are still out of sync; only then is a
+            # fresh scan needed to show what remains.
             self._preview_selected_modpack()
 
+    def _on_sync_failed(self, message: str) -> None:
+        self._sync_cleanup()
+        self._set_status("Sync failed", is_error=True)
+        self.append_log(f"❌ Sync failed: {message}")
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Sync Failed",
+            f"<b>Synchronization failed:</b><br><br>{message}"
+        )
+        self._preview_selected_modpack()
+
 
 def create_main_window() -> MainWindow:
     """Factory function to create the main window."""
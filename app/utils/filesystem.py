@@ -3,25 +3,96 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
 import hashlib
+import mmap
 import os
+import queue
 import shutil
 import time
 
+# Digests are only compared for local equality, never used for security, so
+# prefer the much faster non-cryptographic hashes when they are installed.
+try:
+    import blake3  # type: ignore
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+
 
 BUFFER_SIZE = 1024 * 1024
 
+# Files above this size are memory-mapped for hashing so pages stream
+# straight into the hasher instead of being copied through bytes objects.
+MMAP_THRESHOLD = 1_000_000
+
+if blake3 is not None:
+    HASH_ALGO = "blake3"
+    _new_hasher = blake3.blake3
+elif xxhash is not None:
+    HASH_ALGO = "xxh3_128"
+    _new_hasher = xxhash.xxh3_128
+else:
+    HASH_ALGO = "sha256"
+    _new_hasher = hashlib.sha256
+
+
+# Reusable read buffers shared by hashing workers. readinto + a pooled
+# bytearray means small-file hashing allocates nothing per chunk; the pool
+# never grows past the number of concurrent borrowers.
+_buffer_pool: queue.LifoQueue = queue.LifoQueue()
+
+
+def _borrow_buffer() -> bytearray:
+    try:
+        return _buffer_pool.get_nowait()
+    except queue.Empty:
+        return bytearray(BUFFER_SIZE)
+
 
 def hash_file(path: Path) -> str:
-    """Calculate a SHA-256 hash for the given file."""
+    """Calculate a content hash for the given file.
 
-    digest = hashlib.sha256()
+    Uses BLAKE3 or XXH3 when available, falling back to SHA-256. The active
+    algorithm is exposed as ``HASH_ALGO`` so stored digests can be invalidated
+    when it changes.
+    """
+
+    if blake3 is not None:
+        # blake3 hashes the mapped file with its own thread pool, which
+        # beats even the single-threaded mmap path below on large JARs.
+        digest = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        try:
+            digest.update_mmap(path)
+        except (OSError, ValueError):
+            return ""
+        return digest.hexdigest()
+
+    digest = _new_hasher()
     try:
         with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(BUFFER_SIZE), b""):
-                digest.update(chunk)
-    except OSError:
+            size = os.fstat(fh.fileno()).st_size
+            if size > MMAP_THRESHOLD:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    digest.update(mm)
+            else:
+                buffer = _borrow_buffer()
+                try:
+                    view = memoryview(buffer)
+                    while True:
+                        read = fh.readinto(buffer)
+                        if not read:
+                            break
+                        digest.update(view[:read])
+                finally:
+                    _buffer_pool.put(buffer)
+    except (OSError, ValueError):
         return ""
     return digest.hexdigest()
 
@@ -38,11 +109,74 @@ def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def copy_file(source: Path, destination: Path) -> None:
-    """Copy a file to the destination, preserving metadata."""
+def copy_file(
+    source: Path,
+    destination: Path,
+    preserve_metadata: bool = False,
+    make_parents: bool = True,
+) -> None:
+    """Copy a file to the destination, preserving timestamps.
+
+    ``shutil.copyfile`` delegates the data path to the kernel where possible
+    (``sendfile``/``copy_file_range`` on Linux, ``fcopyfile`` on macOS), so
+    the bytes never pass through userspace. Only the timestamps are copied
+    afterwards — the sync history relies on mtimes matching the source, but
+    the full ``copystat`` permission/xattr dance of ``copy2`` is not needed
+    for game files. Callers that do need it can opt in with
+    ``preserve_metadata``. Batch callers that have already created every
+    destination directory can pass ``make_parents=False`` to skip the
+    per-file mkdir.
+    """
+
+    if make_parents:
+        ensure_parent(destination)
+    # A destination hardlinked elsewhere (dedup'd by an earlier sync) must
+    # not be rewritten in place: copyfile opens with O_TRUNC and would
+    # change the twin's content through the shared inode. Unlink first so
+    # the write lands on a fresh inode and the twin keeps its bytes.
+    try:
+        if os.stat(destination).st_nlink > 1:
+            os.unlink(destination)
+    except OSError:
+        pass
+    shutil.copyfile(source, destination)
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+        return
+    st = os.stat(source)
+    os.utime(destination, ns=(st.st_atime_ns, st.st_mtime_ns))
+
 
-    ensure_parent(destination)
-    shutil.copy2(source, destination)
+def copy_file_dedup(
+    source: Path,
+    destination: Path,
+    src_hash: Optional[str],
+    known_hashes: Dict[str, Path],
+    make_parents: bool = True,
+) -> None:
+    """Copy a file, hardlinking instead when identical content is known.
+
+    ``known_hashes`` maps content digests to files already present in the
+    destination tree; a hit is satisfied with ``os.link`` so duplicated
+    archives cost a directory entry instead of a full rewrite. Linked files
+    share the donor's timestamps, which may miss the mtime cache on the
+    next scan — the digest comparison then proves them unchanged. Any
+    ``os.link`` failure (cross-device, unsupported filesystem, Windows
+    without privileges) falls back to a plain copy.
+    """
+
+    known = known_hashes.get(src_hash) if src_hash else None
+    if known is not None and known != destination:
+        if make_parents:
+            ensure_parent(destination)
+        try:
+            if destination.exists():
+                destination.unlink()
+            os.link(known, destination)
+            return
+        except OSError:
+            pass
+    copy_file(source, destination, make_parents=make_parents)
 
 
 def remove_file(path: Path) -> None:
@@ -54,6 +188,44 @@ def remove_file(path: Path) -> None:
         return
 
 
+class BackupSession:
+    """Collect all backups of one sync run under a single timestamped dir.
+
+    The per-file helper below stamps and mkdirs on every call, and two
+    backups of same-named files in one second collide. A session computes
+    the timestamp once, creates the directory lazily on first use, and
+    preserves each file's relative layout so names cannot clash.
+    """
+
+    def __init__(self, backup_root: Path) -> None:
+        self.backup_root = backup_root
+        self._session_dir: Optional[Path] = None
+
+    def _ensure_dir(self) -> Optional[Path]:
+        if self._session_dir is None:
+            candidate = self.backup_root / time.strftime("%Y%m%d_%H%M%S")
+            try:
+                candidate.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return None
+            self._session_dir = candidate
+        return self._session_dir
+
+    def add(self, source: Path, relative_path: Path) -> Optional[Path]:
+        """Back up ``source`` under the session dir at ``relative_path``."""
+
+        session_dir = self._ensure_dir()
+        if session_dir is None:
+            return None
+        target = session_dir / relative_path
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+            return target
+        except OSError:
+            return None
+
+
 def create_backup(source: Path, backup_root: Path) -> Optional[Path]:
     """Create a timestamped backup of a file under the backup directory."""
 
@@ -72,12 +244,33 @@ def create_backup(source: Path, backup_root: Path) -> Optional[Path]:
         return None
 
 
-def prune_empty_dirs(base_path: Path) -> None:
-    """Remove empty directories under the given base path."""
+def prune_empty_dirs(base_path: Path, touched: Optional[Iterable[Path]] = None) -> None:
+    """Remove empty directories under the given base path.
+
+    When ``touched`` is given (directories that lost files during a sync),
+    only those and their ancestors up to ``base_path`` are tried — a handful
+    of rmdir calls instead of one failing syscall per directory in the tree.
+    Without it, the full bottom-up walk is used.
+    """
 
     if not base_path.exists():
         return
 
+    if touched is not None:
+        candidates: set[Path] = set()
+        for directory in touched:
+            current = directory
+            while current != base_path and base_path in current.parents:
+                candidates.add(current)
+                current = current.parent
+        # Deepest first so emptied children unlock their parents.
+        for directory in sorted(candidates, key=lambda p: len(p.parts), reverse=True):
+            try:
+                directory.rmdir()
+            except OSError:
+                continue
+        return
+
     # Walk bottom-up to remove empty folders
     for root, dirs, _ in os.walk(base_path, topdown=False):
         root_path = Path(root)